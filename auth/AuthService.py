@@ -1,18 +1,97 @@
+import asyncio
+import hashlib
+import logging
+import time
+
 import httpx
-from fastapi import HTTPException, Header
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Parses the Authorization header once per request and gives the OpenAPI
+# docs a proper Bearer auth scheme. auto_error=False because the scheme's
+# own error is a 403; missing credentials should get the same 401 +
+# WWW-Authenticate the rest of this module returns.
+_bearer_scheme = HTTPBearer(auto_error=False)
+
 
 class AuthService:
+    # How long a successful introspection result may be served from memory
+    CACHE_TTL_SECONDS = 60
+    CACHE_MAX_SIZE = 10_000
+
     def __init__(self, introspect_url: str):
         self.introspect_url = introspect_url
+        # Cache of token fingerprint -> (expires_at, introspection response) so
+        # repeat requests with the same Bearer token skip the network round-trip.
+        # Keyed on a SHA-256 of the token, never the raw token itself.
+        self._cache: dict = {}
+        self._cache_lock = asyncio.Lock()
+        # Single long-lived client so the keep-alive connection pool to the
+        # introspection endpoint is reused instead of a TLS handshake per
+        # request. Created lazily: the uvicorn supervisor also imports the
+        # module-level singletons and should not own a client it never uses.
+        self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        # No lock needed: callers all run on the event loop and there is no
+        # await between the check and the assignment
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
+        return self._client
 
-    async def verify_token(self, authorization: Optional[str] = Header(None)) -> dict:
+    async def close(self):
+        """Close the shared HTTP client (call on application shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _cache_get(self, cache_key: str) -> Optional[dict]:
+        """Return a cached introspection result if present and not expired"""
+        async with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if not entry:
+                return None
+            expires_at, introspect_data = entry
+            if time.monotonic() >= expires_at:
+                del self._cache[cache_key]
+                return None
+            return introspect_data
+
+    async def _cache_put(self, cache_key: str, introspect_data: dict):
+        """Cache a successful introspection result, bounded by the token's exp claim"""
+        ttl = self.CACHE_TTL_SECONDS
+        exp = introspect_data.get("exp")
+        if exp:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+        async with self._cache_lock:
+            if len(self._cache) >= self.CACHE_MAX_SIZE:
+                self._cache.clear()
+            self._cache[cache_key] = (time.monotonic() + ttl, introspect_data)
+
+    async def _cache_invalidate(self, cache_key: str):
+        """Drop a cached entry for a token that failed introspection"""
+        async with self._cache_lock:
+            self._cache.pop(cache_key, None)
+
+    async def verify_token(
+        self,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme)
+    ) -> dict:
         """
         Verify the authorization token by calling the introspect endpoint
 
         Args:
-            authorization: Authorization header value (e.g., "Bearer <token>")
+            credentials: Bearer credentials extracted by the HTTPBearer
+                scheme, or None if the header was missing or malformed
 
         Returns:
             dict: Token introspection response
@@ -20,54 +99,52 @@ class AuthService:
         Raises:
             HTTPException: If token is missing, invalid, or introspection fails
         """
-
-        print(authorization)
-        if not authorization:
+        if credentials is None:
             raise HTTPException(
                 status_code=401,
-                detail="Authorization header is missing",
+                detail="Authorization header missing or invalid",
                 headers={"WWW-Authenticate": "Bearer"}
             )
+        token = credentials.credentials
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        # Log only a fingerprint, never the raw token
+        logger.debug("Verifying token %s", cache_key[:8])
 
-        # Extract token from "Bearer <token>"
-        parts = authorization.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid authorization header format. Expected: Bearer <token>",
-                headers={"WWW-Authenticate": "Bearer"}
-            )
-
-        token = parts[1]
+        # Serve recently validated tokens from memory
+        cached = await self._cache_get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            # Call introspect endpoint
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    self.introspect_url,
-                    headers={
-                             "Authorization": f"Bearer {token}",
-                             }
+            # Call introspect endpoint over the pooled connection
+            response = await self._get_client().get(
+                self.introspect_url,
+                headers={
+                         "Authorization": f"Bearer {token}",
+                         }
 
+            )
+            if response.status_code != 200:
+                await self._cache_invalidate(cache_key)
+                raise HTTPException(
+                    status_code=401,
+                    detail=f"Token introspection failed: {response.text}",
+                    headers={"WWW-Authenticate": "Bearer"}
                 )
-                if response.status_code != 200:
-                    raise HTTPException(
-                        status_code=401,
-                        detail=f"Token introspection failed: {response.text}",
-                        headers={"WWW-Authenticate": "Bearer"}
-                    )
-
-                introspect_data = response.json()
-
-                # Check if token is active
-                if not introspect_data.get("active", False):
-                    raise HTTPException(
-                        status_code=401,
-                        detail="Token is not active or has expired",
-                        headers={"WWW-Authenticate": "Bearer"}
-                    )
-
-                return introspect_data
+
+            introspect_data = response.json()
+
+            # Check if token is active
+            if not introspect_data.get("active", False):
+                await self._cache_invalidate(cache_key)
+                raise HTTPException(
+                    status_code=401,
+                    detail="Token is not active or has expired",
+                    headers={"WWW-Authenticate": "Bearer"}
+                )
+
+            await self._cache_put(cache_key, introspect_data)
+            return introspect_data
 
         except httpx.RequestError as e:
             raise HTTPException(
@@ -1,7 +1,7 @@
-from pydantic import  Field
+import os
 from functools import lru_cache
 
-from pydantic.v1 import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = (os.cpu_count() or 1) * 2 + 1
+    # Origins allowed by CORS, e.g. CORS_ORIGINS=["https://app.example.com"]
+    cors_origins: list = []
 
     # Database
     db_host: str = "localhost"
@@ -19,6 +22,10 @@ class Settings(BaseSettings):
     db_name: str
     db_user: str
     db_password: str
+    # Connection pool bounds. Size the max at roughly
+    # workers x expected in-flight queries per worker.
+    db_min_conn: int = 5
+    db_max_conn: int = 25
 
     # Mail Server
     mail_server_host: str
@@ -29,9 +36,7 @@ class Settings(BaseSettings):
 
     introspect_url: str
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
 @lru_cache()
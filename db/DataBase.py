@@ -1,8 +1,29 @@
+import logging
+import threading
+
 import psycopg2
 from psycopg2 import pool, Error
+from psycopg2.extras import RealDictCursor, register_uuid
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
+# Let uuid.UUID objects pass straight through as parameters (and come back
+# as uuid.UUID) instead of round-tripping through 36-char strings
+register_uuid()
+
+
+class _PreparedStateConnection(psycopg2.extensions.connection):
+    """
+    Connection that remembers whether the registered PREPAREs have run on it.
+
+    The flag lives on the connection object itself, so it dies with the
+    connection: the pool can discard and redial connections freely without
+    any bookkeeping elsewhere going stale.
+    """
+    prepared = False
+
 
 class Database:
     """
@@ -27,26 +48,76 @@ class Database:
         self.database = database
         self.user = user
         self.password = password
+        self.min_conn = min_conn
+        self.max_conn = max_conn
+
+        # Statements PREPAREd once per pooled connection so Postgres skips
+        # parse/plan on repeat executions (psycopg2 has no statement cache);
+        # each connection carries its own prepared flag
+        self._prepared_statements = {}
+
+        # The pool is dialed lazily on first use: with multiple uvicorn
+        # workers the supervisor process also imports the module-level
+        # singletons, and it must not hold min_conn idle Postgres
+        # connections it will never use
+        self.connection_pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self):
+        """Return the connection pool, creating it on first use"""
+        connection_pool = self.connection_pool
+        if connection_pool is None:
+            with self._pool_lock:
+                if self.connection_pool is None:
+                    try:
+                        # ThreadedConnectionPool is required because queries
+                        # run from FastAPI's threadpool; SimpleConnectionPool
+                        # is not thread-safe.
+                        self.connection_pool = psycopg2.pool.ThreadedConnectionPool(
+                            self.min_conn,
+                            self.max_conn,
+                            host=self.host,
+                            port=self.port,
+                            database=self.database,
+                            user=self.user,
+                            password=self.password,
+                            connection_factory=_PreparedStateConnection
+                        )
+                        logger.info(
+                            "Database connection pool created (%s:%s/%s)",
+                            self.host, self.port, self.database
+                        )
+                    except (Exception, Error) as error:
+                        logger.error("Error creating connection pool: %s", error)
+                        raise
+                connection_pool = self.connection_pool
+        return connection_pool
+
+    def register_prepared(self, name: str, statement: str):
+        """
+        Register a server-side prepared statement
 
-        try:
-            # Create connection pool
-            self.connection_pool = psycopg2.pool.SimpleConnectionPool(
-                min_conn,
-                max_conn,
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
+        The statement is PREPAREd lazily on each pooled connection the first
+        time that connection is used, so callers can run `EXECUTE name (...)`
+        and Postgres skips parse/plan on every subsequent execution.
 
-            if self.connection_pool:
-                print(f"✓ Database connection pool created successfully")
-                print(f"  Host: {self.host}:{self.port}")
-                print(f"  Database: {self.database}")
-        except (Exception, Error) as error:
-            print(f"✗ Error creating connection pool: {error}")
-            raise
+        Args:
+            name: Prepared statement name (used in EXECUTE)
+            statement: Full PREPARE statement, e.g.
+                "PREPARE my_stmt (text) AS SELECT * FROM t WHERE col = $1"
+        """
+        self._prepared_statements[name] = statement
+
+    def _prepare_connection(self, connection):
+        """Run all registered PREPARE statements on a fresh pooled connection"""
+        cursor = connection.cursor()
+        try:
+            for statement in self._prepared_statements.values():
+                cursor.execute(statement)
+            connection.commit()
+            connection.prepared = True
+        finally:
+            cursor.close()
 
     @contextmanager
     def get_connection(self):
@@ -58,8 +129,11 @@ class Database:
                 # use connection
         """
         connection = None
+        connection_pool = self._get_pool()
         try:
-            connection = self.connection_pool.getconn()
+            connection = connection_pool.getconn()
+            if self._prepared_statements and not connection.prepared:
+                self._prepare_connection(connection)
             yield connection
         except (Exception, Error) as error:
             if connection:
@@ -67,22 +141,24 @@ class Database:
             raise error
         finally:
             if connection:
-                self.connection_pool.putconn(connection)
+                connection_pool.putconn(connection)
 
     @contextmanager
-    def get_cursor(self, commit: bool = False):
+    def get_cursor(self, commit: bool = False, cursor_factory=RealDictCursor):
         """
         Context manager to get a cursor from the pool
 
         Args:
             commit: Whether to auto-commit after cursor operations
+            cursor_factory: psycopg2 cursor factory (default RealDictCursor so
+                rows come back as dicts built in C; pass None for raw tuples)
 
         Usage:
             with db.get_cursor(commit=True) as cursor:
                 cursor.execute("INSERT INTO ...")
         """
         with self.get_connection() as connection:
-            cursor = connection.cursor()
+            cursor = connection.cursor(cursor_factory=cursor_factory)
             try:
                 yield cursor
                 if commit:
@@ -111,18 +187,10 @@ class Database:
             with self.get_cursor() as cursor:
                 cursor.execute(query, params)
 
-                # Get column names from cursor description
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-
-                # Fetch all results
-                rows = cursor.fetchall()
-
-                # Convert to list of dictionaries
-                results = [dict(zip(columns, row)) for row in rows]
-
-                return results
+                # RealDictCursor already materializes rows as dicts in C
+                return cursor.fetchall()
         except (Exception, Error) as error:
-            print(f"✗ Error executing query: {error}")
+            logger.error("Error executing query: %s", error)
             raise
 
     def execute_update(self, query: str, params: Optional[Tuple] = None) -> int:
@@ -148,7 +216,7 @@ class Database:
                 rows_affected = cursor.rowcount
                 return rows_affected
         except (Exception, Error) as error:
-            print(f"✗ Error executing update: {error}")
+            logger.error("Error executing update: %s", error)
             raise
 
     def execute_many(self, query: str, params_list: List[Tuple]) -> int:
@@ -174,7 +242,7 @@ class Database:
                 rows_affected = cursor.rowcount
                 return rows_affected
         except (Exception, Error) as error:
-            print(f"✗ Error executing batch query: {error}")
+            logger.error("Error executing batch query: %s", error)
             raise
 
     def execute_raw(self, query: str, params: Optional[Tuple] = None, fetch: bool = True) -> Optional[List[Tuple]]:
@@ -193,7 +261,7 @@ class Database:
             raw_results = db.execute_raw("SELECT id, name FROM users")
         """
         try:
-            with self.get_cursor(commit=not fetch) as cursor:
+            with self.get_cursor(commit=not fetch, cursor_factory=None) as cursor:
                 cursor.execute(query, params)
 
                 if fetch:
@@ -201,7 +269,7 @@ class Database:
                 else:
                     return None
         except (Exception, Error) as error:
-            print(f"✗ Error executing raw query: {error}")
+            logger.error("Error executing raw query: %s", error)
             raise
 
     def execute_transaction(self, queries: List[Tuple[str, Optional[Tuple]]]) -> bool:
@@ -235,7 +303,7 @@ class Database:
                     cursor.close()
                     raise error
         except (Exception, Error) as error:
-            print(f"✗ Error executing transaction: {error}")
+            logger.error("Error executing transaction: %s", error)
             raise
 
     def test_connection(self) -> bool:
@@ -246,15 +314,16 @@ class Database:
             True if connection is successful, False otherwise
         """
         try:
-            with self.get_cursor() as cursor:
+            # Raw tuple cursor: the probe reads by position, not column name
+            with self.get_cursor(cursor_factory=None) as cursor:
                 cursor.execute("SELECT 1")
                 result = cursor.fetchone()
                 if result and result[0] == 1:
-                    print("✓ Database connection test successful")
+                    logger.info("Database connection test successful")
                     return True
                 return False
         except (Exception, Error) as error:
-            print(f"✗ Database connection test failed: {error}")
+            logger.error("Database connection test failed: %s", error)
             return False
 
     def close_all_connections(self):
@@ -264,7 +333,7 @@ class Database:
         """
         if self.connection_pool:
             self.connection_pool.closeall()
-            print("✓ All database connections closed")
+            logger.info("All database connections closed")
 
     def __del__(self):
         """Destructor to ensure connections are closed"""
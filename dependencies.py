@@ -0,0 +1,37 @@
+from auth.AuthService import AuthService
+from config import get_settings
+from db.DataBase import Database
+from mail_server.MailServer import MailServer
+from services.MailService import MailService
+from services.NotificationIngestor import NotificationIngestor
+from services.NotificationService import NotificationService
+from services.TemplateRenderer import TemplateRenderer
+
+configs = get_settings()
+
+# Shared service singletons, built once per worker process and imported by
+# both the app and the routers
+mail_server = MailServer(
+    host=configs.mail_server_host,
+    port=configs.mail_server_port,
+    e_mail=configs.email,
+    password=configs.email_app_password
+)
+data_base = Database(
+    host=configs.db_host,
+    port=configs.db_port,
+    database=configs.db_name,
+    user=configs.db_user,
+    password=configs.db_password,
+    min_conn=configs.db_min_conn,
+    max_conn=configs.db_max_conn
+)
+
+template_renderer = TemplateRenderer()
+mail_service = MailService(mail_server=mail_server, template_renderer=template_renderer)
+notification_store = NotificationService(data_base=data_base)
+notification_ingestor = NotificationIngestor(notification_store=notification_store)
+auth_service = AuthService(introspect_url=configs.introspect_url)
+
+# Auth dependency: bind the bound method directly, no wrapper coroutine
+verify_token = auth_service.verify_token
@@ -1,17 +1,21 @@
-from pydantic import BaseModel, EmailStr
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
 class PurchasingStatusEmail(BaseModel):
     # Customer details
-    email: Optional[EmailStr] = None
+    # Addresses come from internal systems that already validated them, so a
+    # cheap shape check in pydantic-core replaces the heavy email-validator run
+    to_email: str = Field(..., min_length=3, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
     customer_name: Optional[str] = None
 
     # Car details
-    make: str
-    model: str
-    year: Optional[int] = None
-    chassis_id: Optional[str] = None
+    car_make: str
+    car_model: str
+    car_year: Optional[str] = None
+    chassis_number: Optional[str] = None
 
     # Purchasing status details
     old_status: Optional[str] = None
@@ -22,7 +26,8 @@ class PurchasingStatusEmail(BaseModel):
     lc_number: Optional[str] = None  # Letter of Credit number
     supplier_name: Optional[str] = None
     port_of_loading: Optional[str] = None
-    expected_shipping_date: Optional[str] = None
+    # Parsed once by pydantic-core from ISO strings; formatted at render time
+    expected_shipping_date: Optional[datetime] = None
     purchase_price: Optional[str] = None
     currency: Optional[str] = None
 
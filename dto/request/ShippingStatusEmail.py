@@ -1,10 +1,14 @@
-from pydantic import BaseModel, EmailStr
+from datetime import datetime
+
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
 class ShippingStatusEmail(BaseModel):
     # Customer details
-    email: Optional[EmailStr] = None
+    # Addresses come from internal systems that already validated them, so a
+    # cheap shape check in pydantic-core replaces the heavy email-validator run
+    email: Optional[str] = Field(None, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
     customer_name: Optional[str] = None
     vehicle_code: str
 
@@ -26,9 +30,10 @@ class ShippingStatusEmail(BaseModel):
     bill_of_lading: Optional[str] = None  # B/L number
     port_of_loading: Optional[str] = None
     port_of_discharge: Optional[str] = None
-    estimated_arrival_date: Optional[str] = None
-    actual_arrival_date: Optional[str] = None
-    delivery_date: Optional[str] = None
+    # Parsed once by pydantic-core from ISO strings; formatted at render time
+    estimated_arrival_date: Optional[datetime] = None
+    actual_arrival_date: Optional[datetime] = None
+    delivery_date: Optional[datetime] = None
     tracking_url: Optional[str] = None
 
     # Additional information
@@ -1,22 +1,30 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any, Optional
 
 
 class NotificationItem(BaseModel):
     """Individual notification item in the response"""
+    # Instantiated per list element (up to 100 per page); forbidding extras
+    # skips unknown-field handling and frozen enables cheaper dunders
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     notification_id: str
     notification_type: str
     source: str
     payload: Dict[str, Any]
     priority: str
-    timestamp: str
+    timestamp: datetime
     reference_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
-    stored_at: str
+    stored_at: datetime
 
 
 class PaginationMeta(BaseModel):
     """Pagination metadata"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     total: int = Field(..., description="Total number of notifications")
     page: int = Field(..., description="Current page number (1-indexed)")
     page_size: int = Field(..., description="Number of items per page")
@@ -28,8 +36,8 @@ class PaginatedNotificationsResponse(BaseModel):
     notifications: List[NotificationItem]
     pagination: PaginationMeta
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "notifications": [
                     {
@@ -55,3 +63,4 @@ class PaginatedNotificationsResponse(BaseModel):
                 }
             }
         }
+    )
@@ -1,9 +1,40 @@
+import smtplib
+from datetime import datetime
+
 from fastapi import HTTPException
 
 from dto.request import PurchasingStatusEmail
 from services.TemplateRenderer import TemplateRenderer
 from mail_server.MailServer import MailServer
 
+# Optional sections as (template placeholder, DTO attribute, HTML fragment);
+# each fragment is only formatted when the attribute has a value
+_PURCHASE_SECTIONS = (
+    ("chassis_number_section", "chassis_number",
+     '<div class="info-item"><strong>Chassis Number:</strong> {}</div>'),
+    ("purchase_order_section", "purchase_order_id",
+     '<div class="info-item"><strong>Purchase Order:</strong> {}</div>'),
+    ("lc_number_section", "lc_number",
+     '<div class="info-item"><strong>LC Number:</strong> {}</div>'),
+    ("supplier_section", "supplier_name",
+     '<div class="info-item"><strong>Supplier:</strong> {}</div>'),
+    ("port_loading_section", "port_of_loading",
+     '<div class="info-item"><strong>Port of Loading:</strong> {}</div>'),
+    ("shipping_date_section", "expected_shipping_date",
+     '<div class="info-item"><strong>Expected Shipping Date:</strong> {}</div>'),
+    ("notes_section", "notes",
+     '<div class="highlight"><p class="info-label">📌 Important Notes</p><p>{}</p></div>'),
+    ("contact_section", "contact_person",
+     '<div class="info-item"><strong>Contact Person:</strong> {}</div>'),
+)
+
+
+def _display(value):
+    """Format a section value for the email body"""
+    if isinstance(value, datetime):
+        return value.isoformat(" ", "minutes")
+    return value
+
 
 class EmailPurchaseHandler:
 
@@ -11,90 +42,58 @@ class EmailPurchaseHandler:
         self.template_renderer = template_renderer
         self.mail_server = mail_server
 
+    @staticmethod
+    def _car_info(purchase: PurchasingStatusEmail) -> str:
+        """Build car info in a single allocation"""
+        return (
+            f"{purchase.car_make} {purchase.car_model} ({purchase.car_year})"
+            if purchase.car_year else f"{purchase.car_make} {purchase.car_model}"
+        )
+
+    def build_email(self, purchase: PurchasingStatusEmail):
+        """Render the purchase update as a (to_email, subject, html_body) triple"""
+        car_info = self._car_info(purchase)
+
+        # Build status message
+        if purchase.old_status:
+            status_message = f"Great news! Your vehicle purchase status has been updated from <strong>{purchase.old_status}</strong> to <strong>{purchase.new_status}</strong>."
+        else:
+            status_message = f"Your vehicle purchase status is now: <strong>{purchase.new_status}</strong>"
+
+        # Build conditional sections in one pass over the table
+        sections = {
+            key: (fragment.format(_display(value)) if (value := getattr(purchase, attr)) else "")
+            for key, attr, fragment in _PURCHASE_SECTIONS
+        }
+
+        # Price combines two fields, so it doesn't fit the table
+        sections["price_section"] = (
+            f'<div class="info-item"><strong>Purchase Price:</strong> {purchase.currency or ""} {purchase.purchase_price}</div>'
+            if purchase.purchase_price else ""
+        )
+
+        # Render against the precompiled segment list for this template
+        html_body = self.template_renderer.render(
+            "purchasing_status_template.html",
+            customer_name=purchase.customer_name,
+            status_message=status_message,
+            new_status=purchase.new_status,
+            car_info=car_info,
+            **sections
+        )
+
+        subject = f"Purchase Update: {purchase.new_status} - {car_info}"
+        return purchase.to_email, subject, html_body
+
     def send_purchase_status_update(self, purchase: PurchasingStatusEmail):
         try:
-            # Load template
-            template_content = self.template_renderer.load_template("purchasing_status_template.html")
-
-            # Build car info
-            car_info = f"{purchase.make} {purchase.model}"
-            if purchase.year:
-                car_info += f" ({purchase.year})"
-
-            # Build status message
-            if purchase.old_status:
-                status_message = f"Great news! Your vehicle purchase status has been updated from <strong>{purchase.old_status}</strong> to <strong>{purchase.new_status}</strong>."
-            else:
-                status_message = f"Your vehicle purchase status is now: <strong>{purchase.new_status}</strong>"
-
-            # Build conditional sections
-            chassis_section = self.template_renderer.build_section(
-                purchase.chassis_id,
-                f'<div class="info-item"><strong>Chassis Number:</strong> {purchase.chassis_id}</div>'
-            )
-
-            po_section = self.template_renderer.build_section(
-                purchase.purchase_order_id,
-                f'<div class="info-item"><strong>Purchase Order:</strong> {purchase.purchase_order_id}</div>'
-            )
-
-            lc_section = self.template_renderer.build_section(
-                purchase.lc_number,
-                f'<div class="info-item"><strong>LC Number:</strong> {purchase.lc_number}</div>'
-            )
-
-            supplier_section = self.template_renderer.build_section(
-                purchase.supplier_name,
-                f'<div class="info-item"><strong>Supplier:</strong> {purchase.supplier_name}</div>'
-            )
-
-            price_section = self.template_renderer.build_section(
-                purchase.purchase_price,
-                f'<div class="info-item"><strong>Purchase Price:</strong> {purchase.currency or ""} {purchase.purchase_price}</div>'
-            )
-
-            port_section = self.template_renderer.build_section(
-                purchase.port_of_loading,
-                f'<div class="info-item"><strong>Port of Loading:</strong> {purchase.port_of_loading}</div>'
-            )
-
-            shipping_date_section = self.template_renderer.build_section(
-                purchase.expected_shipping_date,
-                f'<div class="info-item"><strong>Expected Shipping Date:</strong> {purchase.expected_shipping_date}</div>'
-            )
-
-            notes_section = self.template_renderer.build_section(
-                purchase.notes,
-                f'<div class="highlight"><p class="info-label">📌 Important Notes</p><p>{purchase.notes}</p></div>'
-            )
-
-            contact_section = self.template_renderer.build_section(
-                purchase.contact_person,
-                f'<div class="info-item"><strong>Contact Person:</strong> {purchase.contact_person}</div>'
-            )
-
-            # Render template
-            html_body = self.template_renderer.render_template(
-                template_content,
-                customer_name=purchase.customer_name,
-                status_message=status_message,
-                new_status=purchase.new_status,
-                car_info=car_info,
-                chassis_number_section=chassis_section,
-                purchase_order_section=po_section,
-                lc_number_section=lc_section,
-                supplier_section=supplier_section,
-                price_section=price_section,
-                port_loading_section=port_section,
-                shipping_date_section=shipping_date_section,
-                notes_section=notes_section,
-                contact_section=contact_section
-            )
+            to_email, subject, html_body = self.build_email(purchase)
+            car_info = self._car_info(purchase)
 
             # Send email
             success = self.mail_server.send_email(
-                to_email=purchase.email,
-                subject=f"Purchase Update: {purchase.new_status} - {car_info}",
+                to_email=to_email,
+                subject=subject,
                 body=html_body
             )
 
@@ -111,5 +110,7 @@ class EmailPurchaseHandler:
             else:
                 raise HTTPException(status_code=500, detail="Failed to send email")
 
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
+        except (smtplib.SMTPException, HTTPException):
+            raise
+        # Anything else (bad attribute, missing template, ...) is a bug and
+        # should propagate to FastAPI's default handler unmasked
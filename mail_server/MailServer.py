@@ -1,33 +1,203 @@
+import logging
+import queue
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+import time
+from email.message import EmailMessage
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledConnection:
+    """An authenticated SMTP connection plus the bookkeeping to recycle it"""
+    __slots__ = ("smtp", "messages_sent", "created_at")
+
+    def __init__(self, smtp):
+        self.smtp = smtp
+        self.messages_sent = 0
+        self.created_at = time.monotonic()
 
 
 class MailServer:
+    # Connections held open concurrently; background email sends run in the
+    # threadpool, so a small pool lets bursts send in parallel instead of
+    # serializing on one session
+    POOL_SIZE = 3
+
+    # Recycle a connection after this many messages to stay friendly with
+    # providers that cap messages per session
+    MAX_MESSAGES_PER_CONNECTION = 100
+
+    # Recycle idle connections before the server's own idle timeout kills
+    # them mid-send
+    MAX_CONNECTION_AGE_SECONDS = 100
+
     def __init__(self, host,  port, e_mail, password):
         self.host = host
         self.port = port
         self.e_mail = e_mail
         self.password = password
+        # Pool of long-lived SMTP connections reused across emails so each
+        # send costs one DATA round-trip instead of TCP + TLS + AUTH every
+        # time. Connections are created lazily up to POOL_SIZE.
+        self._pool = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
 
-    def send_email(self, to_email, subject, body):
-        # Create message
-        message = MIMEMultipart("alternative")
+    def _connect(self):
+        """Dial and authenticate a fresh SMTP connection"""
+        smtp = smtplib.SMTP_SSL(self.host, self.port)
+        smtp.login(self.e_mail, self.password)
+        return _PooledConnection(smtp)
+
+    def _discard(self, connection):
+        """Quit a pooled connection, ignoring errors on an already-dead link"""
+        try:
+            connection.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def _is_stale(self, connection):
+        return (
+            connection.messages_sent >= self.MAX_MESSAGES_PER_CONNECTION
+            or time.monotonic() - connection.created_at > self.MAX_CONNECTION_AGE_SECONDS
+        )
+
+    def _acquire(self):
+        """
+        Take a live connection from the pool, dropping any that have gone
+        stale. Dials a new one if the pool is empty and under capacity,
+        otherwise blocks until a connection is released.
+        """
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_stale(connection):
+                self._discard(connection)
+                continue
+            try:
+                connection.smtp.noop()
+                return connection
+            except (smtplib.SMTPException, OSError):
+                self._discard(connection)
+
+        with self._lock:
+            under_capacity = self._created < self.POOL_SIZE
+            if under_capacity:
+                self._created += 1
+        if under_capacity:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        # Pool is at capacity with every connection checked out; wait for one
+        return self._pool.get()
+
+    def _release(self, connection):
+        self._pool.put(connection)
+
+    def close(self):
+        """Close all pooled SMTP connections (call on application shutdown)"""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(connection)
+
+    def _build_message(self, to_email, subject, body):
+        # Create message with the modern EmailMessage API; send_message
+        # serializes it once as bytes instead of as_string()'s Python-level
+        # str round-trip
+        message = EmailMessage()
         message["Subject"] = subject
         message["From"] = self.e_mail
         message["To"] = to_email
+        message.set_content(body, subtype="html", cte="quoted-printable")
+        return message
 
-        # Add HTML content
-        html_part = MIMEText(body, "html")
-        message.attach(html_part)
+    def _reconnect(self):
+        """Dial a replacement for a connection already discarded from the pool"""
+        connection = self._connect()
+        with self._lock:
+            self._created += 1
+        return connection
+
+    def send_email(self, to_email, subject, body):
+        message = self._build_message(to_email, subject, body)
 
         try:
-            # Connect to Gmail SMTP server
-            with smtplib.SMTP_SSL(self.host, self.port) as server:
-                server.login(self.e_mail, self.password)
-                server.sendmail(self.e_mail, to_email, message.as_string())
-            print(f"Email sent successfully to {to_email}")
+            connection = self._acquire()
+            try:
+                try:
+                    connection.smtp.send_message(message)
+                except (smtplib.SMTPServerDisconnected, ConnectionResetError):
+                    # Server dropped the connection under us; redial once
+                    self._discard(connection)
+                    connection = None
+                    connection = self._reconnect()
+                    connection.smtp.send_message(message)
+                connection.messages_sent += 1
+            finally:
+                if connection is not None:
+                    self._release(connection)
+            # Lazy %-style formatting: the message is only built if a handler
+            # at this level is actually attached
+            logger.info("Email sent successfully to %s", to_email)
             return True
-        except Exception as e:
-            print(f"Error sending email: {str(e)}")
+        except Exception:
+            logger.exception("Error sending email to %s", to_email)
             return False
+
+    def send_many(self, emails):
+        """
+        Send several emails back-to-back over one pooled SMTP session.
+
+        An RSET between messages resets the envelope without tearing the
+        session down, so the TLS handshake and AUTH are amortized over the
+        whole batch. Returns the number of messages sent; a message that
+        fails to send is logged and skipped rather than failing the batch.
+
+        Args:
+            emails: iterable of (to_email, subject, body) triples
+        """
+        sent = 0
+        connection = None
+        try:
+            for to_email, subject, body in emails:
+                message = self._build_message(to_email, subject, body)
+                if connection is None:
+                    connection = self._acquire()
+                try:
+                    connection.smtp.send_message(message)
+                except (smtplib.SMTPServerDisconnected, ConnectionResetError):
+                    # Server dropped the session mid-batch; redial once and
+                    # retry this message
+                    self._discard(connection)
+                    connection = None
+                    connection = self._reconnect()
+                    connection.smtp.send_message(message)
+                except smtplib.SMTPException:
+                    logger.exception("Error sending email to %s", to_email)
+                    continue
+                connection.messages_sent += 1
+                sent += 1
+                try:
+                    connection.smtp.rset()
+                except (smtplib.SMTPException, OSError):
+                    # Some servers treat RSET as end-of-session; start fresh
+                    # for the remaining messages
+                    self._discard(connection)
+                    connection = None
+        except Exception:
+            logger.exception("Error sending email batch (%d sent)", sent)
+        finally:
+            if connection is not None:
+                self._release(connection)
+        return sent
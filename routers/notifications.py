@@ -0,0 +1,144 @@
+from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Body
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Dict, Optional
+
+from dependencies import mail_service, notification_ingestor, notification_store, verify_token
+from dto.request import NotificationRequest
+from dto.response import PaginatedNotificationsResponse
+
+router = APIRouter(prefix="/notification-service")
+
+# Internal producers whose payloads are validated at the source; their
+# notifications skip re-validation via model_construct. Only add
+# producer-controlled services here - construct performs no checks at all.
+TRUSTED_SOURCES = {"purchasing-service", "shipping-service"}
+
+
+@router.get("")
+async def root():
+    return {"message": "Email Service API is running"}
+
+
+@router.post("/notifications")
+async def accept_notification(
+    background_tasks: BackgroundTasks,
+    raw_notification: Dict[str, Any] = Body(...),
+    token_data: dict = Depends(verify_token)
+):
+    """
+    Accept notification events and queue them for storage. If an email handler
+    exists for the notification type, an email will be sent in the background
+    after the response is returned. Requires valid Bearer token in
+    Authorization header.
+
+    Storage happens asynchronously: the notification joins an in-process batch
+    queue and is written shortly after the response. Email sending is optional
+    and won't fail the request if no handler exists or sending fails.
+
+    Notifications from trusted internal sources bypass request validation.
+    """
+    try:
+        if raw_notification.get("source") in TRUSTED_SOURCES:
+            notification = NotificationRequest.model_construct(**raw_notification)
+        else:
+            notification = NotificationRequest.model_validate(raw_notification)
+
+        # Hand the notification to the batch ingest worker; the client does
+        # not wait for the DB round-trip
+        notification_ingestor.enqueue(notification)
+
+        # Send the email after the response; the client never waits for the
+        # SMTP round-trip either
+        email_queued = mail_service.supports(notification.notification_type)
+        if email_queued:
+            background_tasks.add_task(
+                mail_service.send_mail,
+                notification.notification_type,
+                notification.payload
+            )
+
+        return {
+            "status": "accepted",
+            "message": (
+                "Notification queued for storage and email queued"
+                if email_queued else "Notification queued for storage"
+            )
+        }
+
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
+
+
+@router.get("/notifications", response_model=PaginatedNotificationsResponse)
+async def get_notifications(
+    page: int = Query(1, ge=1, description="Page number (starts from 1)"),
+    page_size: int = Query(20, ge=1, le=100, description="Number of items per page (max 100)"),
+    notification_type: Optional[str] = Query(None, description="Filter by notification type"),
+    source: Optional[str] = Query(None, description="Filter by source service"),
+    priority: Optional[str] = Query(None, description="Filter by priority level"),
+    token_data: dict = Depends(verify_token)
+):
+    """
+    Retrieve notifications with pagination and optional filters.
+    Requires valid Bearer token in Authorization header.
+
+    Query parameters:
+    - page: Page number (default: 1)
+    - page_size: Items per page (default: 20, max: 100)
+    - notification_type: Filter by notification type (optional)
+    - source: Filter by source service (optional)
+    - priority: Filter by priority level (optional)
+
+    Returns paginated notifications with metadata including total count and page information.
+    """
+    try:
+        # Calculate offset from page number
+        offset = (page - 1) * page_size
+
+        # Get notifications with pagination; the rows carry the total match
+        # count as a window-function column, so one round trip covers both
+        notifications = await run_in_threadpool(
+            notification_store.get_notifications,
+            notification_type=notification_type,
+            source=source,
+            priority=priority,
+            limit=page_size,
+            offset=offset
+        )
+
+        # Total count comes back on every row (0 rows means nothing matched)
+        total_count = notifications[0]['total_count'] if notifications else 0
+
+        # Calculate total pages with pure integer ceiling division
+        total_pages = (total_count + page_size - 1) // page_size
+
+        # Rows come from the database already shaped like NotificationItem,
+        # so serialize them directly with orjson (datetimes handled natively)
+        # instead of a per-item pydantic round-trip. The response_model on the
+        # route stays for OpenAPI only; returning a Response bypasses it.
+        processed_notifications = []
+        for notification in notifications:
+            notif_dict = dict(notification)
+            notif_dict.pop('total_count', None)
+            processed_notifications.append(notif_dict)
+
+        return ORJSONResponse({
+            "notifications": processed_notifications,
+            "pagination": {
+                "total": total_count,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages
+            }
+        })
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving notifications: {str(e)}")
@@ -1,5 +1,10 @@
-from typing import Dict, Any
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Tuple, Union
 from fastapi import HTTPException
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
 
 from dto.request import PurchasingStatusEmail, ShippingStatusEmail
 from emailHandlers.PurchaseEmailHandler import EmailPurchaseHandler
@@ -23,19 +28,37 @@ class MailService:
             mail_server=mail_server
         )
 
-        # Map notification types to (handler, DTO class, handler method name)
+        # Map notification types to (bound send method, bound build method,
+        # DTO class); binding once here drops the per-call getattr
         self.mail_processing_map = {
-            "purchase_status": (self.purchase_handler, PurchasingStatusEmail, "send_purchase_status_update"),
-            "shipping_status": (self.shipping_handler, ShippingStatusEmail, "send_shipping_status_update"),
+            "purchase_status": (
+                self.purchase_handler.send_purchase_status_update,
+                self.purchase_handler.build_email,
+                PurchasingStatusEmail,
+            ),
+            "shipping_status": (
+                self.shipping_handler.send_shipping_status_update,
+                self.shipping_handler.build_email,
+                ShippingStatusEmail,
+            ),
         }
 
-    def send_mail(self, notification_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def supports(self, notification_type: str) -> bool:
+        """Return True if an email handler exists for this notification type"""
+        return notification_type in self.mail_processing_map
+
+    def send_mail(
+        self,
+        notification_type: str,
+        payload: Union[Dict[str, Any], BaseModel]
+    ) -> Dict[str, Any]:
         """
         Process notification and send appropriate email based on notification type
 
         Args:
             notification_type: Type of notification (e.g., 'purchase_status', 'shipping_status')
-            payload: Dictionary containing the notification data
+            payload: Dictionary containing the notification data, or an
+                already-validated email DTO (validation is then skipped)
 
         Returns:
             Dictionary with send result details
@@ -52,19 +75,16 @@ class MailService:
             )
 
         try:
-            # Get handler, DTO class, and method name for this notification type
-            handler, dto_class, method_name = self.mail_processing_map[notification_type]
-
-            # Transform payload from backend format to DTO format
+            send, _build, dto_class = self.mail_processing_map[notification_type]
 
-            # Convert transformed payload to appropriate DTO
-            email_dto = dto_class(**payload)
+            # Callers holding a validated DTO pass it straight through;
+            # only raw dicts pay for pydantic validation here
+            if isinstance(payload, BaseModel):
+                email_dto = payload
+            else:
+                email_dto = dto_class(**payload)
 
-            # Get the handler method and call it
-            handler_method = getattr(handler, method_name)
-            result = handler_method(email_dto)
-
-            return result
+            return send(email_dto)
 
         except ValueError as e:
             # Pydantic validation error when converting payload to DTO
@@ -72,12 +92,6 @@ class MailService:
                 status_code=400,
                 detail=f"Invalid payload for notification type '{notification_type}': {str(e)}"
             )
-        except AttributeError as e:
-            # Handler method not found
-            raise HTTPException(
-                status_code=500,
-                detail=f"Handler configuration error: {str(e)}"
-            )
         except Exception as e:
             # Other unexpected errors
             raise HTTPException(
@@ -85,6 +99,68 @@ class MailService:
                 detail=f"Error sending email: {str(e)}"
             )
 
+    def send_batch(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Render and send several queued emails over one SMTP session.
+
+        All messages go out back-to-back on a single pooled connection (RSET
+        between them), amortizing connection setup over the batch. Entries
+        with unsupported types or invalid payloads are logged and skipped
+        rather than failing the rest of the batch.
+
+        Args:
+            items: iterable of (notification_type, payload) pairs
+
+        Returns:
+            Number of emails successfully sent
+        """
+        emails = []
+        for notification_type, payload in items:
+            entry = self.mail_processing_map.get(notification_type)
+            if entry is None:
+                logger.warning("Skipping unsupported notification type %s in batch", notification_type)
+                continue
+            _send, build, dto_class = entry
+            try:
+                emails.append(build(dto_class(**payload)))
+            except ValueError:
+                logger.exception("Skipping invalid %s payload in batch", notification_type)
+        return self.mail_server.send_many(emails)
+
+    def send_many(self, items: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Send many emails concurrently via a thread pool.
+
+        Where send_batch pushes everything down one SMTP session, this fans
+        out across the connection pool so N sends take roughly
+        ceil(N / pool size) x latency. Workers are capped at the SMTP pool
+        size - more threads would only block in _acquire waiting for a
+        connection. Failures are logged and counted out, not raised.
+
+        Args:
+            items: list of (notification_type, payload) pairs
+
+        Returns:
+            Number of emails successfully sent
+        """
+        if not items:
+            return 0
+        sent = 0
+        with ThreadPoolExecutor(max_workers=self.mail_server.POOL_SIZE) as executor:
+            futures = {
+                executor.submit(self.send_mail, notification_type, payload): notification_type
+                for notification_type, payload in items
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    sent += 1
+                except HTTPException as e:
+                    logger.warning(
+                        "Skipping failed %s email in fan-out: %s", futures[future], e.detail
+                    )
+        return sent
+
     def send_purchase_status_update(self, purchase: PurchasingStatusEmail) -> Dict[str, Any]:
         """
         Send purchase status update email (backward compatible method)
@@ -1,10 +1,34 @@
-import json
+import threading
+import time
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
+
+import orjson
 from fastapi import HTTPException
+from psycopg2.extras import Json, execute_values
 
 from db.DataBase import Database
+from dto.request import NotificationRequest
+
+def _orjson_dumps(obj) -> str:
+    """Serializer handed to the Json adapter; orjson encodes in C"""
+    return orjson.dumps(obj).decode()
+
+
+# The three optional listing filters yield eight possible WHERE shapes.
+# Precompute them once, keyed by a bitmask of which filters are set, so
+# Postgres sees a small, stable set of statement texts instead of a freshly
+# concatenated string per request.
+_FILTER_COLUMNS = ("notification_type", "source", "priority")
+_WHERE_CLAUSES = {
+    mask: " AND ".join(
+        f"{column} = %s"
+        for bit, column in enumerate(_FILTER_COLUMNS)
+        if mask & (1 << bit)
+    ) or "1=1"
+    for mask in range(1 << len(_FILTER_COLUMNS))
+}
 
 
 class NotificationService:
@@ -12,6 +36,32 @@ class NotificationService:
     Service for storing notifications in PostgreSQL database
     """
 
+    # Single-row reads served from memory for this long; bounds staleness
+    # for the (unexpected) case of a row changing underneath us
+    CACHE_TTL_SECONDS = 300
+    # Entry cap; the cache is cleared wholesale when full, same as the token
+    # cache in AuthService
+    CACHE_MAX_SIZE = 10_000
+
+    # Prepared once per pooled connection; EXECUTE skips parse/plan on the
+    # high-frequency insert path
+    _INSERT_PREPARE = """
+    PREPARE store_notification (uuid, text, text, jsonb, text, timestamptz, text, jsonb, timestamptz) AS
+    INSERT INTO notifications.notifications (
+        notification_id, notification_type, source, payload,
+        priority, timestamp, reference_id, metadata, stored_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    """
+
+    # Batch insert; execute_values expands all rows into one VALUES list so a
+    # whole batch costs a single statement and round trip
+    _INSERT_VALUES = """
+    INSERT INTO notifications.notifications (
+        notification_id, notification_type, source, payload,
+        priority, timestamp, reference_id, metadata, stored_at
+    ) VALUES %s
+    """
+
     def __init__(self, data_base: Database):
         """
         Initialize the notification service with database connection
@@ -20,13 +70,34 @@ class NotificationService:
             data_base: Database instance for storing notifications
         """
         self.data_base = data_base
+        self.data_base.register_prepared("store_notification", self._INSERT_PREPARE)
+        # Notifications are immutable once stored, so single-row reads are
+        # safe to cache; deletes invalidate their entry explicitly
+        self._id_cache = {}
+        self._id_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _filter_clause(notification_type, source, priority):
+        """
+        Map the set filters to a precomputed WHERE clause and its parameters
 
-    def store_notification(self, notification_data: Dict[str, Any]) -> Dict[str, Any]:
+        Returns:
+            Tuple of (where_clause, params list)
+        """
+        mask = 0
+        params = []
+        for bit, value in enumerate((notification_type, source, priority)):
+            if value:
+                mask |= 1 << bit
+                params.append(value)
+        return _WHERE_CLAUSES[mask], params
+
+    def store_notification(self, notification: NotificationRequest) -> Dict[str, Any]:
         """
         Store a notification in the database
 
         Args:
-            notification_data: Dictionary containing notification fields
+            notification: Validated notification request model
 
         Returns:
             Dictionary with storage confirmation details
@@ -35,42 +106,18 @@ class NotificationService:
             HTTPException: If storage operation fails
         """
         try:
-            # Generate unique notification ID
-            notification_id = str(uuid.uuid4())
-
-            # Auto-generate timestamp if not provided
-            timestamp = notification_data.get("timestamp")
-            if not timestamp:
-                timestamp = datetime.now(timezone.utc).isoformat()
-
-            # Prepare data for insertion
-            notification_type = notification_data["notification_type"]
-            source = notification_data["source"]
-            payload = json.dumps(notification_data["payload"])  # Convert dict to JSON string
-            priority = notification_data.get("priority", "normal")
-            reference_id = notification_data.get("reference_id")
-            metadata = json.dumps(notification_data.get("metadata")) if notification_data.get("metadata") else None
-            stored_at = datetime.now(timezone.utc).isoformat()
-
-            # Insert into database
-            insert_query = """
-            INSERT INTO notifications.notifications (
-                notification_id, notification_type, source, payload,
-                priority, timestamp, reference_id, metadata, stored_at
-            ) VALUES (%s, %s, %s, %s::jsonb, %s, %s, %s, %s::jsonb, %s)
-            """
+            row = self._insert_row(notification)
 
-            self.data_base.execute_update(
-                insert_query,
-                (notification_id, notification_type, source, payload,
-                 priority, timestamp, reference_id, metadata, stored_at)
-            )
+            # Insert via the per-connection prepared statement
+            insert_query = "EXECUTE store_notification (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+            self.data_base.execute_update(insert_query, row)
 
             return {
-                "notification_id": notification_id,
-                "notification_type": notification_type,
-                "source": source,
-                "stored_at": stored_at
+                "notification_id": row[0],
+                "notification_type": notification.notification_type,
+                "source": notification.source,
+                "stored_at": row[8]
             }
 
         except Exception as e:
@@ -79,16 +126,111 @@ class NotificationService:
                 detail=f"Error storing notification: {str(e)}"
             )
 
+    @staticmethod
+    def _insert_row(notification: NotificationRequest) -> tuple:
+        """
+        Build the insert parameter tuple for one notification.
+
+        Reads fields straight off the model; the JSONB columns go through
+        the psycopg2 Json adapter (backed by orjson's C encoder) so the
+        driver serializes and quotes them itself. UUID and datetime values
+        are passed as native objects for the driver's own adapters - no
+        intermediate strings. The timestamp is auto-generated if not
+        provided.
+        """
+        now = datetime.now(timezone.utc)
+        return (
+            uuid.uuid4(),
+            notification.notification_type,
+            notification.source,
+            Json(notification.payload, dumps=_orjson_dumps),
+            notification.priority,
+            notification.timestamp or now,
+            notification.reference_id,
+            Json(notification.metadata, dumps=_orjson_dumps) if notification.metadata else None,
+            now,
+        )
+
+    def store_notifications(self, notifications: List[NotificationRequest]) -> List[Dict[str, Any]]:
+        """
+        Store a batch of notifications in one statement
+
+        execute_values expands every row into a single multi-row VALUES
+        insert, so the whole batch costs one round trip and one parse/plan
+        instead of one per notification.
+
+        Args:
+            notifications: Validated notification request models
+
+        Returns:
+            List of storage confirmation details, one per notification
+
+        Raises:
+            HTTPException: If the batch insert fails (nothing is stored)
+        """
+        if not notifications:
+            return []
+        try:
+            rows = [self._insert_row(notification) for notification in notifications]
+
+            with self.data_base.get_cursor(commit=True) as cursor:
+                execute_values(cursor, self._INSERT_VALUES, rows)
+
+            return [
+                {
+                    "notification_id": row[0],
+                    "notification_type": notification.notification_type,
+                    "source": notification.source,
+                    "stored_at": row[8]
+                }
+                for notification, row in zip(notifications, rows)
+            ]
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error storing notification batch: {str(e)}"
+            )
+
+    def _cache_get(self, notification_id: str) -> Optional[Dict[str, Any]]:
+        """Return a cached row if present and not expired"""
+        with self._id_cache_lock:
+            entry = self._id_cache.get(notification_id)
+            if entry is None:
+                return None
+            expires_at, row = entry
+            if expires_at < time.time():
+                del self._id_cache[notification_id]
+                return None
+            return row
+
+    def _cache_put(self, notification_id: str, row: Dict[str, Any]) -> None:
+        """Cache a row, clearing the cache wholesale if it is full"""
+        with self._id_cache_lock:
+            if len(self._id_cache) >= self.CACHE_MAX_SIZE:
+                self._id_cache.clear()
+            self._id_cache[notification_id] = (time.time() + self.CACHE_TTL_SECONDS, row)
+
+    def _cache_invalidate(self, notification_id: str) -> None:
+        with self._id_cache_lock:
+            self._id_cache.pop(notification_id, None)
+
     def get_notification_by_id(self, notification_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a notification by ID
 
+        Stored notifications never change, so hits are served from the
+        in-process cache without touching the database.
+
         Args:
             notification_id: UUID of the notification
 
         Returns:
             Notification data as dictionary or None if not found
         """
+        cached = self._cache_get(notification_id)
+        if cached is not None:
+            return cached
         try:
             query = """
             SELECT notification_id, notification_type, source, payload,
@@ -100,12 +242,9 @@ class NotificationService:
             results = self.data_base.execute_query(query, (notification_id,))
 
             if results:
+                # JSONB fields come back already parsed by psycopg2
                 notification = results[0]
-                # Parse JSON fields
-                if notification.get('payload'):
-                    notification['payload'] = notification['payload']  # Already parsed by psycopg2 for JSONB
-                if notification.get('metadata'):
-                    notification['metadata'] = notification['metadata']
+                self._cache_put(notification_id, notification)
                 return notification
             return None
 
@@ -134,30 +273,18 @@ class NotificationService:
             offset: Number of results to skip
 
         Returns:
-            List of notifications
+            List of notifications; each row includes a total_count column
+            with the total number of rows matching the filters
         """
         try:
-            # Build dynamic query
-            where_clauses = []
-            params = []
-
-            if notification_type:
-                where_clauses.append("notification_type = %s")
-                params.append(notification_type)
-
-            if source:
-                where_clauses.append("source = %s")
-                params.append(source)
-
-            if priority:
-                where_clauses.append("priority = %s")
-                params.append(priority)
-
-            where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+            where_clause, params = self._filter_clause(notification_type, source, priority)
 
+            # COUNT(*) OVER() returns the total matching-row count alongside the
+            # page itself, saving the separate count query round trip
             query = f"""
             SELECT notification_id, notification_type, source, payload,
-                   priority, timestamp, reference_id, metadata, stored_at
+                   priority, timestamp, reference_id, metadata, stored_at,
+                   COUNT(*) OVER() AS total_count
             FROM notifications.notifications
             WHERE {where_clause}
             ORDER BY stored_at DESC
@@ -181,36 +308,37 @@ class NotificationService:
         self,
         notification_type: Optional[str] = None,
         source: Optional[str] = None,
-        priority: Optional[str] = None
+        priority: Optional[str] = None,
+        exact: bool = False
     ) -> int:
         """
         Get count of notifications with optional filters
 
+        Unfiltered counts come from the planner's row estimate in pg_class,
+        an O(1) catalog read instead of an O(N) aggregate; pass exact=True
+        to force the full COUNT(*). Filtered counts are always exact.
+
         Args:
             notification_type: Filter by notification type
             source: Filter by source
             priority: Filter by priority
+            exact: Force an exact COUNT(*) even with no filters
 
         Returns:
             Number of notifications matching filters
         """
         try:
-            where_clauses = []
-            params = []
-
-            if notification_type:
-                where_clauses.append("notification_type = %s")
-                params.append(notification_type)
-
-            if source:
-                where_clauses.append("source = %s")
-                params.append(source)
-
-            if priority:
-                where_clauses.append("priority = %s")
-                params.append(priority)
-
-            where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+            if not exact and not (notification_type or source or priority):
+                results = self.data_base.execute_query(
+                    "SELECT reltuples::bigint AS count FROM pg_class "
+                    "WHERE oid = 'notifications.notifications'::regclass"
+                )
+                # reltuples is -1 until the table's first VACUUM/ANALYZE;
+                # fall through to the exact count in that case
+                if results and results[0]['count'] >= 0:
+                    return results[0]['count']
+
+            where_clause, params = self._filter_clause(notification_type, source, priority)
 
             query = f"""
             SELECT COUNT(*) as count
@@ -241,6 +369,7 @@ class NotificationService:
         try:
             query = "DELETE FROM notifications.notifications WHERE notification_id = %s"
             rows_affected = self.data_base.execute_update(query, (notification_id,))
+            self._cache_invalidate(notification_id)
             return rows_affected > 0
 
         except Exception as e:
@@ -260,11 +389,12 @@ class NotificationService:
             Number of notifications deleted
         """
         try:
-            query = """
-            DELETE FROM notifications.notifications
-            WHERE stored_at < NOW() - INTERVAL '%s days'
-            """
-            rows_affected = self.data_base.execute_update(query, (days,))
+            # Compute the cutoff in Python and pass it as a plain timestamptz
+            # parameter: no interval-literal string formatting, and the
+            # constant comparison keeps the btree index on stored_at usable
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+            query = "DELETE FROM notifications.notifications WHERE stored_at < %s"
+            rows_affected = self.data_base.execute_update(query, (cutoff,))
             return rows_affected
 
         except Exception as e:
@@ -1,24 +1,81 @@
 import os
+import re
 from pathlib import Path
 
 
 class TemplateRenderer:
+    # Matches {{placeholder}} markers; compiled once for all renders
+    _PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
     def __init__(self, template_dir="templates"):
         self.template_dir = Path(__file__).parent.parent / template_dir
+        # Templates are static at runtime, so cache file contents after the
+        # first read instead of hitting the disk for every email
+        self._template_cache = {}
+        # Templates pre-split on their placeholders: alternating literal
+        # segments (even indices) and placeholder names (odd indices), so
+        # rendering is a straight join with no scanning at all
+        self._compiled_cache = {}
+        self.preload()
+
+    def preload(self):
+        """Eagerly load every template so the first email pays no disk I/O"""
+        if self.template_dir.is_dir():
+            for path in self.template_dir.glob("*.html"):
+                self._compile(path.name)
 
     def load_template(self, template_name: str) -> str:
-        """Load HTML template from file"""
-        template_path = self.template_dir / template_name
-        with open(template_path, 'r', encoding='utf-8') as file:
-            return file.read()
+        """Load HTML template from file (cached after first read)"""
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template_path = self.template_dir / template_name
+            with open(template_path, 'r', encoding='utf-8') as file:
+                template = file.read()
+            self._template_cache[template_name] = template
+        return template
+
+    def _compile(self, template_name: str) -> list:
+        """Split a template into literal/placeholder segments (cached)"""
+        segments = self._compiled_cache.get(template_name)
+        if segments is None:
+            # re.split with the capturing group yields
+            # [literal, name, literal, name, ..., literal]
+            segments = self._PLACEHOLDER_RE.split(self.load_template(template_name))
+            self._compiled_cache[template_name] = segments
+        return segments
+
+    def render(self, template_name: str, **kwargs) -> str:
+        """
+        Render a template by name using its precompiled segment list.
+
+        The placeholder positions were found once at load time, so each
+        render is a single join over the segments: no regex, no scanning of
+        the HTML body. Falsy or missing values render as empty strings.
+        """
+        segments = self._compile(template_name)
+        return "".join(
+            (str(value) if (value := kwargs.get(segment)) else "")
+            if index & 1 else segment
+            for index, segment in enumerate(segments)
+        )
 
     def render_template(self, template_content: str, **kwargs) -> str:
-        """Replace template placeholders with actual values"""
-        for key, value in kwargs.items():
-            placeholder = f"{{{{{key}}}}}"
-            template_content = template_content.replace(placeholder, str(value) if value else "")
-        return template_content
-
-    def build_section(self, condition, content: str) -> str:
-        """Return content if condition is True, empty string otherwise"""
-        return content if condition else ""
+        """
+        Replace template placeholders with actual values.
+
+        Walks the template once with a precompiled regex instead of one full
+        str.replace scan per placeholder; falsy or missing values render as
+        empty strings.
+        """
+        return self._PLACEHOLDER_RE.sub(
+            lambda match: str(value) if (value := kwargs.get(match.group(1))) else "",
+            template_content
+        )
+
+    def build_section(self, value, template: str) -> str:
+        """
+        Format template with value if value is truthy, empty string otherwise.
+
+        The template uses a {} placeholder, so callers pass the format string
+        verbatim and no interpolation happens for empty fields.
+        """
+        return template.format(value) if value else ""
@@ -23,4 +23,10 @@ CREATE INDEX IF NOT EXISTS idx_notifications_priority
 	ON notifications.notifications (priority);
 
 CREATE INDEX IF NOT EXISTS idx_notifications_stored_at
-	ON notifications.notifications (stored_at);
\ No newline at end of file
+	ON notifications.notifications (stored_at);
+
+-- Backs the filtered listing query: equality filters on the leading columns
+-- with stored_at DESC matching its ORDER BY, so pages come straight off an
+-- index range scan instead of a seq scan + sort
+CREATE INDEX IF NOT EXISTS idx_notifications_filter
+	ON notifications.notifications (notification_type, source, priority, stored_at DESC);
\ No newline at end of file